@@ -6,6 +6,8 @@ import time
 import json
 import requests
 import webbrowser
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageTk
 from io import BytesIO
 from novel_downloader import NovelDownloaderAPI, api_manager, async_api_manager
@@ -63,6 +65,13 @@ class ModernNovelDownloaderGUI:
         
         # 初始化版本信息
         self.current_version = __version__
+        # 更新检查复用的会话，避免每次检查都重新握手
+        self._update_session = None
+        # 标记是否有更新检查正在进行，避免重复点击叠加请求
+        self._update_checking = threading.Event()
+        # 更新检查结果的磁盘缓存，跨进程复用，减少GitHub API请求
+        self._update_cache_file = os.path.join(tempfile.gettempdir(), "tomato_update_cache.json")
+        self._update_cache_ttl = 300  # 秒
 
         # 清理可能残留的更新备份文件和旧日志
         # self._cleanup_update_backups()  # 废弃的方法
@@ -3028,19 +3037,92 @@ API数量: {saved_api_count}个
         except Exception as e:
             self.log(f"提示更新失败: {e}")
 
+    def _get_update_session(self) -> requests.Session:
+        """获取更新检查专用的会话（懒加载，复用 GitHub 连接）"""
+        sess = self._update_session
+        if sess is None:
+            sess = requests.Session()
+            retries = Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=("GET",),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+            sess.mount('https://', adapter)
+            sess.headers.update({
+                'User-Agent': f'Fanqie-novel-Downloader/{self.current_version}',
+                'Accept': 'application/vnd.github+json',
+                'Connection': 'keep-alive'
+            })
+            self._update_session = sess
+        return sess
+
+    def _load_update_cache(self):
+        """读取更新检查缓存（仓库不一致或读取失败时返回空字典）"""
+        try:
+            with open(self._update_cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict) and cache.get('repo') == __github_repo__:
+                return cache
+        except Exception:
+            pass
+        return {}
+
+    def _save_update_cache(self, cache):
+        """原子写入更新检查缓存"""
+        try:
+            tmp_file = self._update_cache_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+            os.replace(tmp_file, self._update_cache_file)
+        except Exception:
+            pass
+
+    def _fetch_latest_tag(self):
+        """获取最新发布的标签名，缓存未过期时不访问网络，过期后按ETag条件请求；请求失败返回None"""
+        cache = self._load_update_cache()
+        if cache.get('tag_name') and time.time() - cache.get('checked_at', 0) < self._update_cache_ttl:
+            return cache['tag_name']
+
+        api_url = f"https://api.github.com/repos/{__github_repo__}/releases/latest"
+        # 携带ETag发起条件请求，未变化时GitHub返回304且不计入速率限制
+        headers = {}
+        if cache.get('etag') and cache.get('tag_name'):
+            headers['If-None-Match'] = cache['etag']
+        response = self._get_update_session().get(api_url, headers=headers, timeout=10)
+        if response.status_code == 304:
+            cache['checked_at'] = time.time()
+            self._save_update_cache(cache)
+            return cache['tag_name']
+        if response.status_code != 200:
+            return None
+
+        tag_name = response.json().get('tag_name', '')
+        self._save_update_cache({
+            'repo': __github_repo__,
+            'tag_name': tag_name,
+            'etag': response.headers.get('ETag', ''),
+            'checked_at': time.time()
+        })
+        return tag_name
+
     def check_update_now(self):
         """立即检查更新（手动触发）"""
         releases_url = f"https://github.com/{__github_repo__}/releases/latest"
+
+        # 已有检查在进行中，直接忽略本次请求
+        if self._update_checking.is_set():
+            return
+        self._update_checking.set()
         
         # 先尝试检查是否有新版本
         def check_version():
             try:
-                import requests
-                api_url = f"https://api.github.com/repos/{__github_repo__}/releases/latest"
-                response = requests.get(api_url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    latest_version = data.get('tag_name', '').lstrip('v')
+                latest_tag = self._fetch_latest_tag()
+                if latest_tag is not None:
+                    latest_version = latest_tag.lstrip('v')
                     current_version = self.current_version.lstrip('v')
                     
                     if latest_version and latest_version != current_version:
@@ -3055,6 +3137,8 @@ API数量: {saved_api_count}个
             except Exception:
                 # 检查失败，直接打开页面
                 self.root.after(0, lambda: self._open_releases_page(releases_url))
+            finally:
+                self._update_checking.clear()
         
         # 在后台线程检查版本
         threading.Thread(target=check_version, daemon=True).start()